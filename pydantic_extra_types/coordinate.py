@@ -1,15 +1,36 @@
 """
 The `pydantic_extra_types.coordinate` module provides the [`Latitude`][pydantic_extra_types.coordinate.Latitude],
 [`Longitude`][pydantic_extra_types.coordinate.Longitude], and
-[`Coordinate`][pydantic_extra_types.coordinate.Coordinate] data types.
+[`Coordinate`][pydantic_extra_types.coordinate.Coordinate] data types, along with the
+[`validate_latitude`][pydantic_extra_types.coordinate.validate_latitude],
+[`validate_longitude`][pydantic_extra_types.coordinate.validate_longitude], and
+[`validate_coordinate`][pydantic_extra_types.coordinate.validate_coordinate] functions to validate them outside a model.
 """
 
+import io
 from dataclasses import dataclass
-from typing import Any, ClassVar, Tuple, Type
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Tuple, Type, Union, cast
 
-from pydantic import GetCoreSchemaHandler
-from pydantic._internal import _repr
-from pydantic_core import ArgsKwargs, PydanticCustomError, core_schema
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler, TypeAdapter
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import ArgsKwargs, PydanticCustomError, PydanticKnownError, core_schema
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+_ERR_TYPE = 'coordinate_error'
+_ERR_NOT_COORD_STR = 'value is not a valid coordinate: string is not recognized as a valid coordinate'
+
+
+def _import_numpy(feature: str) -> Any:
+    try:
+        import numpy
+    except ModuleNotFoundError as e:  # pragma: no cover
+        raise RuntimeError(
+            f'`{feature}` requires "numpy" to be installed. You can install it with "pip install numpy".'
+        ) from e
+    return numpy
 
 
 class Latitude(float):
@@ -30,10 +51,17 @@ class Latitude(float):
 
     min: ClassVar[float] = -90.00
     max: ClassVar[float] = 90.00
+    _core_schema: ClassVar[core_schema.FloatSchema] = core_schema.float_schema(ge=min, le=max)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # subclasses may narrow `min` and `max`
+        cls._core_schema = core_schema.float_schema(ge=cls.min, le=cls.max)
 
     @classmethod
     def __get_pydantic_core_schema__(cls, source: Type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
-        return core_schema.float_schema(ge=cls.min, le=cls.max)
+        # pydantic adds metadata to the schema it gets back, so hand out a copy
+        return cls._core_schema.copy()
 
 
 class Longitude(float):
@@ -55,14 +83,21 @@ class Longitude(float):
 
     min: ClassVar[float] = -180.00
     max: ClassVar[float] = 180.00
+    _core_schema: ClassVar[core_schema.FloatSchema] = core_schema.float_schema(ge=min, le=max)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # subclasses may narrow `min` and `max`
+        cls._core_schema = core_schema.float_schema(ge=cls.min, le=cls.max)
 
     @classmethod
     def __get_pydantic_core_schema__(cls, source: Type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
-        return core_schema.float_schema(ge=cls.min, le=cls.max)
+        # pydantic adds metadata to the schema it gets back, so hand out a copy
+        return cls._core_schema.copy()
 
 
 @dataclass
-class Coordinate(_repr.Representation):
+class Coordinate:
     """Coordinate parses Latitude and Longitude.
 
     You can use the `Coordinate` data type for storing coordinates. Coordinates can be
@@ -84,6 +119,8 @@ class Coordinate(_repr.Representation):
     ```
     """
 
+    __slots__ = ('latitude', 'longitude')
+
     _NULL_ISLAND: ClassVar[Tuple[float, float]] = (0.0, 0.0)
 
     latitude: Latitude
@@ -91,54 +128,272 @@ class Coordinate(_repr.Representation):
 
     @classmethod
     def __get_pydantic_core_schema__(cls, source: Type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
-        schema_chain = [
-            core_schema.no_info_wrap_validator_function(cls._parse_str, core_schema.str_schema()),
-            core_schema.no_info_wrap_validator_function(
-                cls._parse_tuple,
-                handler.generate_schema(Tuple[float, float]),
+        dataclass_schema = cast(core_schema.DataclassSchema, handler(source))
+
+        def json_schema(schema: core_schema.CoreSchema, json_handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+            if json_handler.mode == 'serialization':
+                return json_handler(schema)
+            # `_parse_args` accepts tuples and strings on top of the dataclass input
+            return json_handler(
+                core_schema.union_schema(
+                    [
+                        dataclass_schema,
+                        core_schema.tuple_schema([core_schema.float_schema(), core_schema.float_schema()]),
+                        core_schema.str_schema(),
+                    ]
+                )
+            )
+
+        # instances can only be handed back as-is when the config does not ask for them to be revalidated,
+        # pydantic-core reads the setting from the schema first and then from its config
+        config = dataclass_schema.get('config', {})
+        if dataclass_schema.get('revalidate_instances', config.get('revalidate_instances', 'never')) == 'never':
+            parse_args = cls._parse_instance_or_args
+        else:
+            parse_args = cls._parse_args
+
+        # the ref has to sit on the outer schema, otherwise later uses of `Coordinate` skip `_parse_args`
+        ref = dataclass_schema.pop('ref', None)
+        # in strict mode Python input has to be an instance, which the dataclass schema checks by itself,
+        # while JSON has no instances and takes objects and `'latitude,longitude'` strings
+        return core_schema.lax_or_strict_schema(
+            lax_schema=core_schema.no_info_wrap_validator_function(parse_args, dataclass_schema),
+            strict_schema=core_schema.json_or_python_schema(
+                json_schema=core_schema.no_info_wrap_validator_function(cls._parse_strict_json, dataclass_schema),
+                python_schema=dataclass_schema,
             ),
-            handler(source),
-        ]
-
-        chain_length = len(schema_chain)
-        chain_schemas = [core_schema.chain_schema(schema_chain[x:]) for x in range(chain_length - 1, -1, -1)]
-        return core_schema.no_info_wrap_validator_function(
-            cls._parse_args,
-            core_schema.union_schema(chain_schemas),  # type: ignore[arg-type]
+            ref=ref,
+            metadata={'pydantic_js_annotation_functions': [json_schema]},
         )
 
+    @classmethod
+    def _parse_instance_or_args(cls, value: Any, handler: core_schema.ValidatorFunctionWrapHandler) -> Any:
+        if type(value) is cls:
+            return value
+        return cls._parse_args(value, handler)
+
     @classmethod
     def _parse_args(cls, value: Any, handler: core_schema.ValidatorFunctionWrapHandler) -> Any:
-        if isinstance(value, ArgsKwargs) and not value.kwargs:
-            n_args = len(value.args)
-            if n_args == 0:
-                value = cls._NULL_ISLAND
-            elif n_args == 1:
-                value = value.args[0]
+        # `ArgsKwargs` cannot be subclassed, so the exact type check is enough
+        if type(value) is ArgsKwargs:
+            if not value.kwargs:
+                n_args = len(value.args)
+                if n_args == 0:
+                    value = cls._NULL_ISLAND
+                elif n_args == 1:
+                    value = value.args[0]
+            elif not value.args and value.kwargs.keys() == _FIELD_NAMES:
+                value = value.kwargs
+        if type(value) is dict and value.keys() == _FIELD_NAMES:
+            # like in `_build`, only the dataclass schema of a subclass knows about its fields and validators
+            if cls is Coordinate and _is_valid_pair(value['latitude'], value['longitude']):
+                return cls(value['latitude'], value['longitude'])
+            return handler(value)
+        parser = _PARSERS.get(type(value))
+        if parser is not None:
+            return cls._build(parser(value), handler)
+        # subclasses, like named tuples, are not in `_PARSERS`
+        if isinstance(value, str):
+            return cls._build(cls._parse_str(value), handler)
+        if isinstance(value, (tuple, list)):
+            return cls._build(cls._parse_tuple(value), handler)
         return handler(value)
 
     @classmethod
-    def _parse_str(cls, value: Any, handler: core_schema.ValidatorFunctionWrapHandler) -> Any:
-        if not isinstance(value, str):
-            return value
+    def _parse_strict_json(cls, value: Any, handler: core_schema.ValidatorFunctionWrapHandler) -> Any:
+        if isinstance(value, str):
+            return cls._build(cls._parse_str(value), handler)
+        return handler(value)
+
+    @classmethod
+    def _parse_str(cls, value: str) -> Tuple[float, float]:
+        # a missing comma leaves `longitude` empty and an extra one stays in it, `float()` rejects both
+        latitude, _, longitude = value.partition(',')
         try:
-            value = tuple(float(x) for x in value.split(','))
-        except ValueError as e:
-            raise PydanticCustomError(
-                'coordinate_error',
-                'value is not a valid coordinate: string is not recognized as a valid coordinate',
-            ) from e
-        return ArgsKwargs(args=value)
+            return float(latitude), float(longitude)
+        except ValueError:
+            raise PydanticCustomError(_ERR_TYPE, _ERR_NOT_COORD_STR) from None
+
+    @classmethod
+    def _parse_tuple(cls, value: Union[Tuple[Any, ...], List[Any]]) -> Tuple[Any, ...]:
+        if len(value) > 2:
+            raise PydanticKnownError('too_long', {'field_type': 'Tuple', 'max_length': 2, 'actual_length': len(value)})
+        return tuple(value)
+
+    @classmethod
+    def _build(cls, args: Tuple[Any, ...], handler: core_schema.ValidatorFunctionWrapHandler) -> Any:
+        # subclasses may change the fields or add validators, only their dataclass schema knows about those
+        if cls is Coordinate and len(args) == 2 and _is_valid_pair(*args):
+            return cls(*args)
+        # anything else goes through the dataclass validator, which coerces the values and reports errors
+        return handler(ArgsKwargs(args=args))
+
+    @classmethod
+    def from_array(cls, latitudes: 'npt.ArrayLike', longitudes: 'npt.ArrayLike') -> 'npt.NDArray[Any]':
+        """Build an object array of `Coordinate` from arrays of latitudes and longitudes.
+
+        The bounds of every value are checked at once with NumPy instead of validating each pair
+        through pydantic, which makes it a lot faster for large arrays.
+
+        ```py
+        from pydantic_extra_types.coordinate import Coordinate
+
+        coordinates = Coordinate.from_array([41.40338, 48.85827], [2.17403, 2.29453])
+        print(coordinates[1])
+        #> 48.85827,2.29453
+        ```
+
+        Args:
+            latitudes: The latitudes, between -90 and 90.
+            longitudes: The longitudes, between -180 and 180, with the same shape as `latitudes`.
+
+        Returns:
+            An array of `Coordinate` with the shape of the inputs, scalars give a one-element array.
+
+        Raises:
+            ValueError: If the shapes differ, or if a value is out of bounds or NaN.
+        """
+        np = _import_numpy('Coordinate.from_array')
+
+        lats = np.asarray(latitudes, dtype=np.float64)
+        lons = np.asarray(longitudes, dtype=np.float64)
+        if lats.shape != lons.shape:
+            raise ValueError(f'latitudes and longitudes must have the same shape, got {lats.shape} and {lons.shape}')
+        # `frompyfunc` would return a bare `Coordinate` for 0-d input
+        lats = np.atleast_1d(lats)
+        lons = np.atleast_1d(lons)
+
+        # fold the comparisons into a single mask in place, NaN fails all of them
+        valid = lats >= Latitude.min
+        valid &= lats <= Latitude.max
+        valid &= lons >= Longitude.min
+        valid &= lons <= Longitude.max
+        invalid = np.flatnonzero(~valid)
+        if invalid.size:
+            i = invalid[0]
+            raise ValueError(
+                f'value is not a valid coordinate: ({lats.flat[i]}, {lons.flat[i]}) at position {i} is out of bounds'
+            )
+        return np.frompyfunc(cls, 2, 1)(lats, lons)  # type: ignore[no-any-return]
 
     @classmethod
-    def _parse_tuple(cls, value: Any, handler: core_schema.ValidatorFunctionWrapHandler) -> Any:
-        return ArgsKwargs(args=handler(value)) if isinstance(value, tuple) else value
+    def parse_bulk(cls, data: Union[str, bytes]) -> 'npt.NDArray[Any]':
+        """Parse newline separated `latitude,longitude` pairs into an object array of `Coordinate`.
+
+        The text is parsed by NumPy's C reader rather than one `float()` call per value in Python,
+        the values are then checked as in [`from_array`][pydantic_extra_types.coordinate.Coordinate.from_array].
+
+        ```py
+        from pydantic_extra_types.coordinate import Coordinate
+
+        coordinates = Coordinate.parse_bulk('41.40338, 2.17403\\n48.85827, 2.29453\\n')
+        print(coordinates[0])
+        #> 41.40338,2.17403
+        ```
+
+        Args:
+            data: The text to parse, one coordinate per line, blank lines are skipped.
+
+        Returns:
+            A one-dimensional array of `Coordinate`.
+
+        Raises:
+            ValueError: If a line does not hold exactly two numbers, or if a value is out of bounds or NaN.
+        """
+        np = _import_numpy('Coordinate.parse_bulk')
+
+        if isinstance(data, bytes):
+            data = data.decode()
+        if not data.strip():
+            return np.empty(0, dtype=object)  # type: ignore[no-any-return]
+
+        values = np.loadtxt(io.StringIO(data), delimiter=',', comments=None, dtype=np.float64, ndmin=2)
+        if values.shape[1] != 2:
+            raise ValueError(f'value is not a valid coordinate: expected 2 values per line, got {values.shape[1]}')
+        return cls.from_array(values[:, 0], values[:, 1])
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(latitude={self.latitude!r}, longitude={self.longitude!r})'
 
     def __str__(self) -> str:
-        return f'{self.latitude},{self.longitude}'
+        # `float.__repr__` gives the same text as `str()`, without going through `format()`
+        return f'{self.latitude!r},{self.longitude!r}'
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Coordinate) and self.latitude == other.latitude and self.longitude == other.longitude
 
     def __hash__(self) -> int:
         return hash((self.latitude, self.longitude))
+
+
+def _is_valid_pair(latitude: Any, longitude: Any) -> bool:
+    # floats within bounds are already valid, the instance can be built without another validation pass
+    return (
+        type(latitude) is float
+        and type(longitude) is float
+        and Latitude.min <= latitude <= Latitude.max
+        and Longitude.min <= longitude <= Longitude.max
+    )
+
+
+_FIELD_NAMES = frozenset(('latitude', 'longitude'))
+_PARSERS: Dict[type, Callable[[Any], Tuple[Any, ...]]] = {
+    str: Coordinate._parse_str,
+    tuple: Coordinate._parse_tuple,
+    list: Coordinate._parse_tuple,
+}
+
+
+# building a `TypeAdapter` is costly, so each one is built on first use and reused afterwards
+@lru_cache
+def _latitude_adapter() -> 'TypeAdapter[Latitude]':
+    return TypeAdapter(Latitude)
+
+
+@lru_cache
+def _longitude_adapter() -> 'TypeAdapter[Longitude]':
+    return TypeAdapter(Longitude)
+
+
+@lru_cache
+def _coordinate_adapter() -> 'TypeAdapter[Coordinate]':
+    return TypeAdapter(Coordinate)
+
+
+def validate_latitude(value: Any) -> float:
+    """Validate a latitude, between -90 and 90, outside of a model.
+
+    ```py
+    from pydantic_extra_types.coordinate import validate_latitude
+
+    print(validate_latitude('41.40338'))
+    #> 41.40338
+    ```
+    """
+    return _latitude_adapter().validate_python(value)
+
+
+def validate_longitude(value: Any) -> float:
+    """Validate a longitude, between -180 and 180, outside of a model.
+
+    ```py
+    from pydantic_extra_types.coordinate import validate_longitude
+
+    print(validate_longitude(2.17403))
+    #> 2.17403
+    ```
+    """
+    return _longitude_adapter().validate_python(value)
+
+
+def validate_coordinate(value: Any) -> Coordinate:
+    """Validate a coordinate, in any of the formats accepted by `Coordinate`, outside of a model.
+
+    ```py
+    from pydantic_extra_types.coordinate import validate_coordinate
+
+    print(repr(validate_coordinate('41.40338, 2.17403')))
+    #> Coordinate(latitude=41.40338, longitude=2.17403)
+    ```
+    """
+    return _coordinate_adapter().validate_python(value)
@@ -1,11 +1,29 @@
+from dataclasses import dataclass
 from re import Pattern
-from typing import Any, Optional
+from typing import Any, List, NamedTuple, Optional
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError, field_validator
+from pydantic.json_schema import models_json_schema
 from pydantic_core._pydantic_core import ArgsKwargs
 
-from pydantic_extra_types.coordinate import Coordinate, Latitude, Longitude
+from pydantic_extra_types.coordinate import (
+    Coordinate,
+    Latitude,
+    Longitude,
+    validate_coordinate,
+    validate_latitude,
+    validate_longitude,
+)
+
+
+class LatLng(NamedTuple):
+    lat: float
+    lng: float
+
+
+class CoordinateStr(str):
+    pass
 
 
 class Coord(BaseModel):
@@ -29,30 +47,38 @@ class Lng(BaseModel):
         (('20.0', 10.0), (20.0, 10.0), None),
         ((20.0, '10.0'), (20.0, 10.0), None),
         ((45.678, -123.456), (45.678, -123.456), None),
+        ([45.678, -123.456], (45.678, -123.456), None),
+        ((20, 10), (20.0, 10.0), None),
+        (LatLng(20.0, 10.0), (20.0, 10.0), None),
         (('45.678, -123.456'), (45.678, -123.456), None),
+        (CoordinateStr('45.678, -123.456'), (45.678, -123.456), None),
         (Coordinate(20.0, 10.0), (20.0, 10.0), None),
         (Coordinate(latitude=0, longitude=0), (0, 0), None),
         (ArgsKwargs(args=()), (0, 0), None),
         (ArgsKwargs(args=(1, 0.0)), (1.0, 0), None),
+        (ArgsKwargs(args=(), kwargs={'latitude': 20.0, 'longitude': 10.0}), (20.0, 10.0), None),
+        ({'latitude': 20.0, 'longitude': 10.0}, (20.0, 10.0), None),
+        ({'latitude': '20.0', 'longitude': 10}, (20.0, 10.0), None),
+        # Unknown keyword arguments are ignored by the dataclass schema
+        (ArgsKwargs(args=(), kwargs={'latitude': 20.0, 'longitude': 10.0, 'x': 0}), (20.0, 10.0), None),
         # # Invalid coordinates
         ((), None, 'Field required'),  # Empty tuple
         ((10.0,), None, 'Field required'),  # Tuple with only one value
         (('ten, '), None, 'string is not recognized as a valid coordinate'),
         ((20.0, 10.0, 30.0), None, 'Tuple should have at most 2 items'),  # Tuple with more than 2 values
+        ([20.0, 10.0, 30.0], None, 'Tuple should have at most 2 items'),  # List with more than 2 values
         (ArgsKwargs(args=(1.0,)), None, 'Input should be a dictionary or an instance of Coordinate'),
-        (
-            '20.0, 10.0, 30.0',
-            None,
-            'Input should be a dictionary or an instance of Coordinate ',
-        ),  # Str with more than 2 values
-        ('20.0, 10.0, 30.0', None, 'Unexpected positional argument'),  # Str with more than 2 values
+        ('20.0, 10.0, 30.0', None, 'string is not recognized as a valid coordinate'),  # Str with more than 2 values
+        ('20.0', None, 'string is not recognized as a valid coordinate'),  # Str with only one value
         (2, None, 'Input should be a dictionary or an instance of Coordinate'),  # Wrong type
+        ('nan, 10.0', None, 'Input should be less than or equal to 90'),
+        ((20.0, float('inf')), None, 'Input should be less than or equal to 180'),
+        ({'latitude': 91.0, 'longitude': 10.0}, None, 'coord.latitude\n  Input should be less than or equal to 90'),
     ],
 )
 def test_format_for_coordinate(coord: (Any, Any), result: (float, float), error: Optional[Pattern]):
     if error is None:
         _coord: Coordinate = Coord(coord=coord).coord
-        print('vars(_coord)', vars(_coord))
         assert _coord.latitude == result[0]
         assert _coord.longitude == result[1]
     else:
@@ -133,12 +159,190 @@ def test_format_longitude(longitude: float, valid: bool):
             Lng(lng=longitude)
 
 
+def test_subclass_bounds():
+    class EuropeLat(Latitude):
+        min = 35.0
+        max = 72.0
+
+    class EuropeLng(Longitude):
+        min = -25.0
+        max = 45.0
+
+    class Location(BaseModel):
+        lat: EuropeLat
+        lng: EuropeLng
+
+    assert Location(lat=48.85827, lng=2.29453).lat == 48.85827
+    with pytest.raises(ValidationError, match='Input should be greater than or equal to 35'):
+        Location(lat=10.0, lng=2.29453)
+    with pytest.raises(ValidationError, match='Input should be less than or equal to 45'):
+        Location(lat=48.85827, lng=100.0)
+    assert Lat(lat=10.0).lat == 10.0
+
+
+@pytest.mark.parametrize('coord', [(20.0, 10.0), '20.0, 10.0', {'latitude': 20, 'longitude': 10}])
+def test_fields_are_plain_floats(coord: Any):
+    _coord = Coord(coord=coord).coord
+    assert type(_coord.latitude) is float
+    assert type(_coord.longitude) is float
+
+
+def test_instance_is_returned_as_is():
+    _coord = Coordinate(20.0, 10.0)
+    assert Coord(coord=_coord).coord is _coord
+
+
+def test_instances_are_revalidated():
+    class RevalidatedCoord(BaseModel):
+        model_config = ConfigDict(revalidate_instances='always')
+
+        coord: Coordinate
+
+    _coord = Coordinate(20.0, 10.0)
+    assert RevalidatedCoord(coord=_coord).coord == _coord
+    _coord.latitude = 500.0
+    with pytest.raises(ValidationError) as exc_info:
+        RevalidatedCoord(coord=_coord)
+    assert [error['type'] for error in exc_info.value.errors()] == ['less_than_equal']
+
+
+@pytest.mark.parametrize(
+    'coord,error_type',
+    [
+        ('20.0', 'coordinate_error'),
+        ((20.0, 200.0), 'less_than_equal'),
+        ([20.0, 10.0, 30.0], 'too_long'),
+        (LatLng(20.0, 200.0), 'less_than_equal'),
+        ({'latitude': 91.0, 'longitude': 10.0}, 'less_than_equal'),
+        (2, 'dataclass_type'),
+    ],
+)
+def test_single_error_per_input(coord: Any, error_type: str):
+    # each input type takes a single validation path, failures are not collected across alternatives
+    with pytest.raises(ValidationError) as exc_info:
+        Coord(coord=coord)
+    assert [error['type'] for error in exc_info.value.errors()] == [error_type]
+
+
+@pytest.mark.parametrize(
+    'coord',
+    [
+        (20.0, 10.0),
+        (20, 10),
+        (100.0, 10.0),
+        [20.0, 10.0],
+        '20.0, 10.0',
+        {'latitude': 20.0, 'longitude': 10.0},
+        ArgsKwargs(args=(20.0, 10.0)),
+    ],
+)
+def test_strict_rejects_non_instances(coord: Any):
+    with pytest.raises(ValidationError) as exc_info:
+        Coord.model_validate({'coord': coord}, strict=True)
+    assert [(error['type'], error['input']) for error in exc_info.value.errors()] == [('dataclass_exact_type', coord)]
+
+
+def test_strict_accepts_instances():
+    _coord = Coordinate(20.0, 10.0)
+    assert Coord.model_validate({'coord': _coord}, strict=True).coord is _coord
+    assert Coord.model_validate_json('{"coord": {"latitude": 20.0, "longitude": 10.0}}', strict=True).coord == _coord
+
+
+@pytest.mark.parametrize(
+    'json_input,result,errors',
+    [
+        ('"20.0,10.0"', Coordinate(20.0, 10.0), None),
+        ('"20, 10"', Coordinate(20.0, 10.0), None),
+        ('"100.0,10.0"', None, ['less_than_equal']),
+        ('"20.0"', None, ['coordinate_error']),
+        ('[20.0, 10.0]', None, ['dataclass_type']),
+    ],
+)
+def test_strict_json(json_input: str, result: Optional[Coordinate], errors: Optional[List[str]]):
+    adapter = TypeAdapter(Coordinate)
+    if result is not None:
+        assert adapter.validate_json(json_input, strict=True) == result
+    else:
+        with pytest.raises(ValidationError) as exc_info:
+            adapter.validate_json(json_input, strict=True)
+        assert [error['type'] for error in exc_info.value.errors()] == errors
+
+
+def test_slots():
+    _coord = Coord(coord=(20.0, 10.0)).coord
+    assert not hasattr(_coord, '__dict__')
+    with pytest.raises(AttributeError):
+        _coord.altitude = 0.0
+
+
 def test_str_repr():
     assert str(Coord(coord=(20.0, 10.0)).coord) == '20.0,10.0'
     assert str(Coord(coord=('20.0, 10.0')).coord) == '20.0,10.0'
     assert repr(Coord(coord=(20.0, 10.0)).coord) == 'Coordinate(latitude=20.0, longitude=10.0)'
 
 
+def test_subclass_repr():
+    class Location(Coordinate):
+        pass
+
+    assert repr(TypeAdapter(Location).validate_python('20.0, 10.0')) == 'Location(latitude=20.0, longitude=10.0)'
+
+
+class EuropeLat(Latitude):
+    min = 35.0
+    max = 72.0
+
+
+@dataclass
+class EuropeCoordinate(Coordinate):
+    latitude: EuropeLat
+
+
+@dataclass
+class RoundedCoordinate(Coordinate):
+    @field_validator('latitude')
+    @classmethod
+    def round_latitude(cls, value: float) -> float:
+        return round(value)
+
+
+@dataclass
+class Coordinate3D(Coordinate):
+    altitude: float
+
+
+@pytest.mark.parametrize('coord', [(10.0, 2.0), '10.0, 2.0', {'latitude': 10.0, 'longitude': 2.0}])
+def test_subclass_fields_are_validated(coord: Any):
+    adapter = TypeAdapter(EuropeCoordinate)
+    with pytest.raises(ValidationError) as exc_info:
+        adapter.validate_python(coord)
+    assert [e['type'] for e in exc_info.value.errors()] == ['greater_than_equal']
+    assert adapter.validate_python((48.5, 2.0)) == EuropeCoordinate(48.5, 2.0)
+
+
+@pytest.mark.parametrize('coord', [(20.4, 10.0), '20.4, 10.0', {'latitude': 20.4, 'longitude': 10.0}])
+def test_subclass_validators_run(coord: Any):
+    assert TypeAdapter(RoundedCoordinate).validate_python(coord).latitude == 20
+
+
+@pytest.mark.parametrize(
+    'coord',
+    [
+        (20.0, 10.0),
+        '20.0, 10.0',
+        {'latitude': 20.0, 'longitude': 10.0},
+        ArgsKwargs((), {'latitude': 20.0, 'longitude': 10.0}),
+    ],
+)
+def test_subclass_extra_fields(coord: Any):
+    adapter = TypeAdapter(Coordinate3D)
+    with pytest.raises(ValidationError) as exc_info:
+        adapter.validate_python(coord)
+    assert [(e['type'], e['loc']) for e in exc_info.value.errors()] == [('missing', ('altitude',))]
+    coord_3d = adapter.validate_python({'latitude': 20.0, 'longitude': 10.0, 'altitude': 5.0})
+    assert coord_3d == Coordinate3D(20.0, 10.0, 5.0)
+
+
 def test_eq():
     assert Coord(coord=(20.0, 10.0)).coord != Coord(coord='20.0,11.0').coord
     assert Coord(coord=('20.0, 10.0')).coord != Coord(coord='20.0,11.0').coord
@@ -149,13 +353,23 @@ def test_eq():
 def test_hashable():
     assert hash(Coord(coord=(20.0, 10.0)).coord) == hash(Coord(coord=(20.0, 10.0)).coord)
     assert hash(Coord(coord=(20.0, 11.0)).coord) != hash(Coord(coord=(20.0, 10.0)).coord)
+    assert hash(Coord(coord=(20.0, 10.0)).coord) == hash(Coordinate(20.0, 10.0))
+    assert len({Coordinate(20.0, 10.0), Coord(coord='20.0, 10.0').coord}) == 1
+
+
+def test_hash_follows_mutation():
+    _coord = Coord(coord=(20.0, 10.0)).coord
+    hash(_coord)
+    _coord.latitude = 5.0
+    assert _coord == Coordinate(5.0, 10.0)
+    assert hash(_coord) == hash(Coordinate(5.0, 10.0))
 
 
 def test_json_schema():
     class Model(BaseModel):
         value: Coordinate
 
-    assert Model.model_json_schema(mode='validation')['$defs']['Coordinate'] == {
+    coordinate_schema = {
         'properties': {
             'latitude': {'maximum': 90.0, 'minimum': -90.0, 'title': 'Latitude', 'type': 'number'},
             'longitude': {'maximum': 180.0, 'minimum': -180.0, 'title': 'Longitude', 'type': 'number'},
@@ -164,9 +378,9 @@ def test_json_schema():
         'title': 'Coordinate',
         'type': 'object',
     }
-    assert Model.model_json_schema(mode='validation')['properties']['value'] == {
+    assert Model.model_json_schema(mode='validation')['$defs']['Coordinate'] == {
         'anyOf': [
-            {'$ref': '#/$defs/Coordinate'},
+            coordinate_schema,
             {
                 'maxItems': 2,
                 'minItems': 2,
@@ -175,22 +389,121 @@ def test_json_schema():
             },
             {'type': 'string'},
         ],
-        'title': 'Value',
     }
+    assert Model.model_json_schema(mode='validation')['properties']['value'] == {'$ref': '#/$defs/Coordinate'}
     assert Model.model_json_schema(mode='serialization') == {
-        '$defs': {
-            'Coordinate': {
-                'properties': {
-                    'latitude': {'maximum': 90.0, 'minimum': -90.0, 'title': 'Latitude', 'type': 'number'},
-                    'longitude': {'maximum': 180.0, 'minimum': -180.0, 'title': 'Longitude', 'type': 'number'},
-                },
-                'required': ['latitude', 'longitude'],
-                'title': 'Coordinate',
-                'type': 'object',
-            }
-        },
-        'properties': {'value': {'$ref': '#/$defs/Coordinate', 'title': 'Value'}},
+        '$defs': {'Coordinate': coordinate_schema},
+        'properties': {'value': {'$ref': '#/$defs/Coordinate'}},
         'required': ['value'],
         'title': 'Model',
         'type': 'object',
     }
+
+
+def test_json_schema_both_modes():
+    class Model(BaseModel):
+        value: Coordinate
+
+    _, schema = models_json_schema([(Model, 'validation'), (Model, 'serialization')])
+    # the accepted input forms live in the definition, so it differs between the two modes
+    assert schema['$defs']['Model-Input']['properties']['value'] == {'$ref': '#/$defs/Coordinate-Input'}
+    assert schema['$defs']['Model-Output']['properties']['value'] == {'$ref': '#/$defs/Coordinate-Output'}
+    assert len(schema['$defs']['Coordinate-Input']['anyOf']) == 3
+    assert schema['$defs']['Coordinate-Output']['type'] == 'object'
+
+
+def test_reused_in_model():
+    class Model(BaseModel):
+        start: Coordinate
+        end: Optional[Coordinate] = None
+        path: List[Coordinate] = []
+
+    model = Model(start='20.0, 10.0', end=(20.0, 11.0), path=[[20.0, 12.0], '20.0, 13.0'])
+    assert model.end == Coordinate(20.0, 11.0)
+    assert model.path == [Coordinate(20.0, 12.0), Coordinate(20.0, 13.0)]
+
+
+@pytest.mark.parametrize('json_input', ['[20.0, 10.0]', '"20.0, 10.0"', '{"latitude": 20.0, "longitude": 10.0}'])
+def test_json_input(json_input: str):
+    assert Coord.model_validate_json(f'{{"coord": {json_input}}}').coord == Coordinate(20.0, 10.0)
+
+
+def test_from_array():
+    np = pytest.importorskip('numpy')
+
+    coordinates = Coordinate.from_array([20.0, -90.0, 90.0], np.array([10.0, -180.0, 180.0]))
+    assert coordinates.dtype == object
+    assert list(coordinates) == [Coordinate(20.0, 10.0), Coordinate(-90.0, -180.0), Coordinate(90.0, 180.0)]
+    assert all(type(c.latitude) is float and type(c.longitude) is float for c in coordinates)
+
+    assert Coordinate.from_array(np.zeros((2, 3)), np.ones((2, 3))).shape == (2, 3)
+
+    scalar = Coordinate.from_array(20.0, 10.0)
+    assert isinstance(scalar, np.ndarray)
+    assert list(scalar) == [Coordinate(20.0, 10.0)]
+
+
+@pytest.mark.parametrize(
+    'latitudes, longitudes, error',
+    [
+        ([20.0, 91.0], [10.0, 10.0], r'\(91.0, 10.0\) at position 1 is out of bounds'),
+        ([20.0, 20.0], [-181.0, 10.0], r'\(20.0, -181.0\) at position 0 is out of bounds'),
+        ([float('nan')], [10.0], r'\(nan, 10.0\) at position 0 is out of bounds'),
+        ([20.0], [10.0, 10.0], 'must have the same shape'),
+        (20.0, [10.0], 'must have the same shape'),
+    ],
+)
+def test_from_array_invalid(latitudes: Any, longitudes: Any, error: str):
+    pytest.importorskip('numpy')
+
+    with pytest.raises(ValueError, match=error):
+        Coordinate.from_array(latitudes, longitudes)
+
+
+@pytest.mark.parametrize('data', ['20.0, 10.0\n-90,-180\n\n90.0,180.0\n', b'20.0,10.0\n-90,-180\n90,180'])
+def test_parse_bulk(data: Any):
+    pytest.importorskip('numpy')
+
+    assert list(Coordinate.parse_bulk(data)) == [
+        Coordinate(20.0, 10.0),
+        Coordinate(-90.0, -180.0),
+        Coordinate(90.0, 180.0),
+    ]
+
+
+def test_parse_bulk_empty():
+    pytest.importorskip('numpy')
+
+    assert Coordinate.parse_bulk('\n').shape == (0,)
+
+
+@pytest.mark.parametrize(
+    'data, error',
+    [
+        ('20.0, 10.0, 30.0\n', 'expected 2 values per line, got 3'),
+        ('20.0\n10.0\n', 'expected 2 values per line, got 1'),
+        ('20.0, 10.0\n91.0, 10.0\n', r'\(91.0, 10.0\) at position 1 is out of bounds'),
+        ('ten, 10.0\n', 'could not convert'),
+        ('20.0, 10.0 # Barcelona\n', 'could not convert'),
+        ('# header\n20.0, 10.0\n', 'could not convert'),
+    ],
+)
+def test_parse_bulk_invalid(data: str, error: str):
+    pytest.importorskip('numpy')
+
+    with pytest.raises(ValueError, match=error):
+        Coordinate.parse_bulk(data)
+
+
+def test_validate_functions():
+    assert validate_latitude('-90.0') == -90.0
+    assert validate_longitude(180) == 180.0
+    assert validate_coordinate('20.0, 10.0') == Coordinate(20.0, 10.0)
+    assert validate_coordinate((20.0, 10.0)) == Coordinate(20.0, 10.0)
+
+    with pytest.raises(ValidationError, match='Input should be greater than or equal to -90'):
+        validate_latitude(-91.0)
+    with pytest.raises(ValidationError, match='Input should be less than or equal to 180'):
+        validate_longitude(181.0)
+    with pytest.raises(ValidationError, match='string is not recognized as a valid coordinate'):
+        validate_coordinate('ten, ')
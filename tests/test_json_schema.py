@@ -174,19 +174,26 @@ USNumberE164 = Annotated[
             {
                 '$defs': {
                     'Coordinate': {
-                        'properties': {
-                            'latitude': {'maximum': 90.0, 'minimum': -90.0, 'title': 'Latitude', 'type': 'number'},
-                            'longitude': {'maximum': 180.0, 'minimum': -180.0, 'title': 'Longitude', 'type': 'number'},
-                        },
-                        'required': ['latitude', 'longitude'],
-                        'title': 'Coordinate',
-                        'type': 'object',
-                    }
-                },
-                'properties': {
-                    'x': {
                         'anyOf': [
-                            {'$ref': '#/$defs/Coordinate'},
+                            {
+                                'properties': {
+                                    'latitude': {
+                                        'maximum': 90.0,
+                                        'minimum': -90.0,
+                                        'title': 'Latitude',
+                                        'type': 'number',
+                                    },
+                                    'longitude': {
+                                        'maximum': 180.0,
+                                        'minimum': -180.0,
+                                        'title': 'Longitude',
+                                        'type': 'number',
+                                    },
+                                },
+                                'required': ['latitude', 'longitude'],
+                                'title': 'Coordinate',
+                                'type': 'object',
+                            },
                             {
                                 'maxItems': 2,
                                 'minItems': 2,
@@ -198,9 +205,9 @@ USNumberE164 = Annotated[
                             },
                             {'type': 'string'},
                         ],
-                        'title': 'X',
-                    },
+                    }
                 },
+                'properties': {'x': {'$ref': '#/$defs/Coordinate'}},
                 'required': ['x'],
                 'title': 'Model',
                 'type': 'object',